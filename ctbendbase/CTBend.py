@@ -4,6 +4,9 @@ import sys
 
 class ConstantOffsetModel(CTBendBase):
 
+    azimuth_term_names = ("azimuth_offset_deg",)
+    elevation_term_names = ("elevation_offset_deg",)
+
     def __init__(self, parameters={"azimuth_offset_deg": 0.,
                                    "elevation_offset_deg": 0.}):
 
@@ -19,205 +22,197 @@ class ConstantOffsetModel(CTBendBase):
         super().__init__(parameters=parameters)
         self.name = self.modelname()
 
-    def azimuth_model_terms(self, az_rad, el_rad):
+    def azimuth_model_terms(self, az_rad, el_rad, out):
 
-        terms = {self.azimuth_parameter_name: 1.}
-        return terms
+        out[0] = 1.
 
-    def azimuth_derivative_phi(self, az_rad, el_rad):
+    def azimuth_derivative_phi(self, az_rad, el_rad, out):
 
-        terms = {self.azimuth_parameter_name: 0.}
-        return terms
+        out[0] = 0.
 
-    def azimuth_derivative_theta(self, az_rad, el_rad):
+    def azimuth_derivative_theta(self, az_rad, el_rad, out):
 
-        terms = {self.elevation_parameter_name: 0.}
-        return terms
+        out[0] = 0.
 
-    def elevation_model_terms(self, az_rad, el_rad):
+    def elevation_model_terms(self, az_rad, el_rad, out):
 
-        terms = {self.elevation_parameter_name: 1.}
-        return terms
+        out[0] = 1.
 
-    def elevation_derivative_phi(self, az_rad, el_rad):
+    def elevation_derivative_phi(self, az_rad, el_rad, out):
 
-        terms = {self.elevation_parameter_name: 0.}
-        return terms
+        out[0] = 0.
 
-    def elevation_derivative_theta(self, az_rad, el_rad):
+    def elevation_derivative_theta(self, az_rad, el_rad, out):
 
-        terms = {self.elevation_parameter_name: 0.}
-        return terms
+        out[0] = 0.
 
 
 class CTBendBasic4(CTBendBase):
 
+    azimuth_term_names = ("IA", "AW", "AN")
+    elevation_term_names = ("IE", "AW", "AN")
+
     def __init__(self, parameters={}):
         super().__init__(parameters)
         self.name = self.modelname()
 
-    def azimuth_model_terms(self, az_rad, el_rad):
-
-        cos = self._math.cos
-        sin = self._math.sin
-        tan = self._math.tan
-
-        terms = {"IA": -1.,
-                 "AW": -cos(az_rad) * tan(el_rad),
-                 "AN": -sin(az_rad) * tan(el_rad),
-                 }
-
-        return terms
+    def azimuth_model_terms(self, az_rad, el_rad, out):
 
-    def azimuth_derivative_phi(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
+        tan = m.tan
 
-        cos = self._math.cos
-        sin = self._math.sin
-        tan = self._math.tan
+        te = tan(el_rad)
 
-        terms = {"IA": 0.,
-                 "AW": sin(az_rad) * tan(el_rad),
-                 "AN": -cos(az_rad) * tan(el_rad),
-                 }
+        out[0] = -1.
+        out[1] = -cos(az_rad) * te
+        out[2] = -sin(az_rad) * te
 
-        return terms
+    def azimuth_derivative_phi(self, az_rad, el_rad, out):
 
-    def azimuth_derivative_theta(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
+        tan = m.tan
 
-        cos = self._math.cos
-        sin = self._math.sin
+        te = tan(el_rad)
 
-        terms = {"IA": 0.,
-                 "AW": -cos(az_rad) / (cos(el_rad) * cos(el_rad)),
-                 "AN": -sin(az_rad) / (cos(el_rad) * cos(el_rad)),
-                 }
+        out[0] = 0.
+        out[1] = sin(az_rad) * te
+        out[2] = -cos(az_rad) * te
 
-        return terms
+    def azimuth_derivative_theta(self, az_rad, el_rad, out):
 
-    def elevation_model_terms(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-        cos = self._math.cos
-        sin = self._math.sin
+        ce = cos(el_rad)
+        inv_ce2 = 1. / (ce * ce)
 
-        terms = {"IE": 1.,
-                 "AW": -sin(az_rad),
-                 "AN": -cos(az_rad),
-                 }
+        out[0] = 0.
+        out[1] = -cos(az_rad) * inv_ce2
+        out[2] = -sin(az_rad) * inv_ce2
 
-        return terms
+    def elevation_model_terms(self, az_rad, el_rad, out):
 
-    def elevation_derivative_phi(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-        cos = self._math.cos
-        sin = self._math.sin
+        out[0] = 1.
+        out[1] = -sin(az_rad)
+        out[2] = -cos(az_rad)
 
-        terms = {"IE": 0.,
-                 "AW": -cos(az_rad),
-                 "AN": sin(az_rad),
-                 }
+    def elevation_derivative_phi(self, az_rad, el_rad, out):
 
-        return terms
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-    def elevation_derivative_theta(self, az_rad, el_rad):
+        out[0] = 0.
+        out[1] = -cos(az_rad)
+        out[2] = sin(az_rad)
 
-        terms = {"IE": 0.,
-                 "AW": 0.,
-                 "AN": 0.,
-                 }
+    def elevation_derivative_theta(self, az_rad, el_rad, out):
 
-        return terms
+        out[0] = 0.
+        out[1] = 0.
+        out[2] = 0.
 
 
 class CTBendBasic8(CTBendBase):
 
+    azimuth_term_names = ("IA", "NPAE", "AW", "AN", "ACES", "ACEC")
+    elevation_term_names = ("IE", "AW", "AN", "TF")
+
     def __init__(self, parameters={}):
         super().__init__(parameters)
         self.name = self.modelname()
 
-    def azimuth_model_terms(self, az_rad, el_rad):
-
-        cos = self._math.cos
-        sin = self._math.sin
-        tan = self._math.tan
-
-        terms = {"IA": -1.,
-                 "NPAE": -tan(el_rad),
-                 "AW": -cos(az_rad) * tan(el_rad),
-                 "AN": -sin(az_rad) * tan(el_rad),
-                 "ACES": sin(az_rad),
-                 "ACEC": cos(az_rad)
-                 }
-
-        return terms
+    def azimuth_model_terms(self, az_rad, el_rad, out):
 
-    def azimuth_derivative_phi(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
+        tan = m.tan
 
-        cos = self._math.cos
-        sin = self._math.sin
-        tan = self._math.tan
+        ca = cos(az_rad)
+        sa = sin(az_rad)
+        te = tan(el_rad)
 
-        terms = {"IA": 0.,
-                 "NPAE": 0.,
-                 "AW": sin(az_rad) * tan(el_rad),
-                 "AN": -cos(az_rad) * tan(el_rad),
-                 "ACES": cos(az_rad),
-                 "ACEC": -sin(az_rad)
-                 }
+        out[0] = -1.
+        out[1] = -te
+        out[2] = -ca * te
+        out[3] = -sa * te
+        out[4] = sa
+        out[5] = ca
 
-        return terms
+    def azimuth_derivative_phi(self, az_rad, el_rad, out):
 
-    def azimuth_derivative_theta(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
+        tan = m.tan
 
-        cos = self._math.cos
-        sin = self._math.sin
+        ca = cos(az_rad)
+        sa = sin(az_rad)
+        te = tan(el_rad)
 
-        terms = {"IA": 0.,
-                 "NPAE": -1. / (cos(el_rad) * cos(el_rad)),
-                 "AW": -cos(az_rad) / (cos(el_rad) * cos(el_rad)),
-                 "AN": -sin(az_rad) / (cos(el_rad) * cos(el_rad)),
-                 "ACES": 0.,
-                 "ACEC": 0.
-                 }
+        out[0] = 0.
+        out[1] = 0.
+        out[2] = sa * te
+        out[3] = -ca * te
+        out[4] = ca
+        out[5] = -sa
 
-        return terms
+    def azimuth_derivative_theta(self, az_rad, el_rad, out):
 
-    def elevation_model_terms(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-        cos = self._math.cos
-        sin = self._math.sin
+        ce = cos(el_rad)
+        inv_ce2 = 1. / (ce * ce)
 
-        terms = {"IE": 1.,
-                 "AW": -sin(az_rad),
-                 "AN": -cos(az_rad),
-                 "TF": cos(el_rad)
-                 }
+        out[0] = 0.
+        out[1] = -inv_ce2
+        out[2] = -cos(az_rad) * inv_ce2
+        out[3] = -sin(az_rad) * inv_ce2
+        out[4] = 0.
+        out[5] = 0.
 
-        return terms
+    def elevation_model_terms(self, az_rad, el_rad, out):
 
-    def elevation_derivative_phi(self, az_rad, el_rad):
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-        cos = self._math.cos
-        sin = self._math.sin
+        out[0] = 1.
+        out[1] = -sin(az_rad)
+        out[2] = -cos(az_rad)
+        out[3] = cos(el_rad)
 
-        terms = {"IE": 0.,
-                 "AW": -cos(az_rad),
-                 "AN": sin(az_rad),
-                 "TF": 0.
-                 }
+    def elevation_derivative_phi(self, az_rad, el_rad, out):
 
-        return terms
+        m = self._math_module(az_rad, el_rad)
+        cos = m.cos
+        sin = m.sin
 
-    def elevation_derivative_theta(self, az_rad, el_rad):
+        out[0] = 0.
+        out[1] = -cos(az_rad)
+        out[2] = sin(az_rad)
+        out[3] = 0.
 
-        sin = self._math.sin
+    def elevation_derivative_theta(self, az_rad, el_rad, out):
 
-        terms = {"IE": 0.,
-                 "AW": 0.,
-                 "AN": 0.,
-                 "TF": -sin(el_rad)
-                 }
+        sin = self._math_module(az_rad, el_rad).sin
 
-        return terms
+        out[0] = 0.
+        out[1] = 0.
+        out[2] = 0.
+        out[3] = -sin(el_rad)
 
 
 def bending_factory(model_json):
@@ -1,143 +1,372 @@
+import math
+import logging
 import numpy as np
 from math import pi
+from numbers import Real
+from types import MappingProxyType
 from scipy.optimize import minimize
 from abc import ABC, abstractmethod
 
 
+_DEG2RAD = pi / 180.
+
+
 def radians(deg):
-    return 2. * pi / 360. * deg
+    return deg * _DEG2RAD
+
+
+def _as_angle(angle):
+    """Converts lists and tuples of angles to ndarrays. Scalars, ndarrays
+       and symbolic tensors are passed through unchanged.
+    """
+    if isinstance(angle, (list, tuple)):
+        return np.asarray(angle, dtype=float)
+    return angle
+
+
+def _is_numeric(angle):
+    """True for plain numbers and arrays of numbers, False for symbolic
+       tensors.
+    """
+    return isinstance(angle, (Real, np.ndarray))
+
+
+def _contract(parameters, terms):
+    """Contracts the last axis of parameters, a vector of shape (K,) or a
+       matrix of shape (M, K), with the first axis of the term matrix of
+       shape (K, ...).
+    """
+    if terms.ndim <= 2:
+        return parameters @ terms
+    return np.tensordot(parameters, terms, axes=1)
 
 
 class CTBendBase(ABC):
     """Base class from which all ctbend models are to be derived.
+
+    Attributes:
+        azimuth_term_names: Names of the azimuth model terms, i.e. of the
+                            parameters weighting them, in the order in
+                            which the azimuth term methods write them.
+        elevation_term_names: Same for the elevation model terms.
+
+    A model declares azimuth_term_names and elevation_term_names and
+    implements the six term methods azimuth_model_terms,
+    azimuth_derivative_phi, azimuth_derivative_theta,
+    elevation_model_terms, elevation_derivative_phi and
+    elevation_derivative_theta. Each term method takes the pointing in
+    radians, az_rad and el_rad, and writes the terms in the order of the
+    term names of its axis into out[i]. The angles are floats, ndarrays or
+    symbolic tensors, so trig functions are taken from
+    self._math_module(az_rad, el_rad). The derivatives are with respect to
+    az_rad (phi) and el_rad (theta). Term methods no longer return a
+    dictionary of terms; models written for that protocol must be ported.
+
+    Models are immutable: the parameters are copied and frozen at
+    construction, and parameters and model_parameters are read-only views.
+    To change parameters, build a new model. The only exception are the
+    priors of a model in training, which the trainer adds to
+    parameters["priors"] after construction.
     """
 
+    azimuth_term_names = ()  # type: tuple
+    elevation_term_names = ()  # type: tuple
+
     def __init__(self, parameters):
         # type: (dict) -> None
 
         """
         Args:
             parameters: Dictionary with parameters of the bending model.
+                        The dictionary is copied, and numerical parameter
+                        values are frozen into parameter vectors at
+                        construction.
         """
 
-        self.parameters = parameters
+        self._parameters = dict(parameters)
         self._math = np
         self.deg2arcsec = 3600.
 
+        # While training, the parameters are prior distributions which the
+        # trainer adds to parameters["priors"] after construction; keep a
+        # reference to that dictionary rather than a copy.
+        self._model_parameters = self._parameters.get("priors",
+                                                      self._parameters)
+
+        self._model_parameter_names = tuple(dict.fromkeys(
+                        self.azimuth_term_names + self.elevation_term_names))
+        self._param_az = self._parameter_vector(self.azimuth_term_names)
+        self._param_el = self._parameter_vector(self.elevation_term_names)
+
     @abstractmethod
-    def azimuth_model_terms(self, az_rad, el_rad):
+    def azimuth_model_terms(self, az_rad, el_rad, out):
+        """Writes the azimuth model terms into out[i], in the order of
+           azimuth_term_names. The same holds for the other term methods,
+           with the elevation terms in the order of elevation_term_names.
+        """
         pass
 
     @abstractmethod
-    def azimuth_derivative_phi(self, az_rad, el_rad):
+    def azimuth_derivative_phi(self, az_rad, el_rad, out):
         pass
 
     @abstractmethod
-    def azimuth_derivative_theta(self, az_rad, el_rad):
+    def azimuth_derivative_theta(self, az_rad, el_rad, out):
         pass
 
     @abstractmethod
-    def elevation_model_terms(self, az_rad, el_rad):
+    def elevation_model_terms(self, az_rad, el_rad, out):
         pass
 
     @abstractmethod
-    def elevation_derivative_phi(self, az_rad, el_rad):
+    def elevation_derivative_phi(self, az_rad, el_rad, out):
         pass
 
     @abstractmethod
-    def elevation_derivative_theta(self, az_rad, el_rad):
+    def elevation_derivative_theta(self, az_rad, el_rad, out):
         pass
 
+    def _math_module(self, az_rad, el_rad):
+        """Math module for the term methods: the math module for float
+           angles (including numpy.float64), which avoids the ufunc overhead
+           of numpy on single values, and self._math for arrays and tensors.
+        """
+
+        if isinstance(az_rad, float) and isinstance(el_rad, float):
+            return math
+        return self._math
+
     @classmethod
     def modelname(cls):
         return cls.__name__
 
+    @classmethod
+    def evaluate_many(cls, parameters, az, el):
+        # type: (list, float, float) -> (np.ndarray, np.ndarray)
+
+        """Pointing corrections of several parameter sets of one model,
+           e.g. posterior samples, for the same pointings. The model terms
+           are evaluated once and contracted with the stacked parameters in
+           one matrix product; no model is built per parameter set.
+
+        Args:
+            parameters: Dictionaries with numerical values of the model
+                        parameters, one per parameter set.
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
+
+        Returns:
+            Pointing corrections in azimuth and elevation in degrees, each
+            of shape (len(parameters),) + broadcast shape of az and el.
+        """
+
+        parameters = list(parameters)
+        if len(parameters) == 0:
+            info = "evaluate_many requires at least one parameter set"
+            raise RuntimeError(info)
+
+        try:
+            parameters_az = np.array([[p[term]
+                                       for term in cls.azimuth_term_names]
+                                      for p in parameters], dtype=float)
+            parameters_el = np.array([[p[term]
+                                       for term in cls.elevation_term_names]
+                                      for p in parameters], dtype=float)
+        except (KeyError, TypeError, ValueError):
+            info = "evaluate_many requires numerical values of all"
+            info += " parameters of " + cls.__name__
+            raise RuntimeError(info)
+
+        # One model provides the term methods for all parameter sets.
+        reference = cls(parameters[0])
+
+        az_rad = np.asarray(az, dtype=float) * _DEG2RAD
+        el_rad = np.asarray(el, dtype=float) * _DEG2RAD
+
+        azimuth_terms = reference._fill_terms(reference.azimuth_model_terms,
+                                              cls.azimuth_term_names,
+                                              az_rad, el_rad)
+        elevation_terms = reference._fill_terms(
+                                            reference.elevation_model_terms,
+                                            cls.elevation_term_names,
+                                            az_rad, el_rad)
+
+        return (_contract(parameters_az, azimuth_terms),
+                _contract(parameters_el, elevation_terms))
+
     def _pointing_correction(self, az, el, altaz):
         # type: (float, float, str) -> float
 
         """Pointing correction.
 
         Args:
-            az: Requested azimuth in degrees.
-            el: Requested elevation in degrees.
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
             altaz: Requested axis; Either 'azimuth' or 'elevation'.
 
         Returns:
             Pointing correction for the requested axis in degrees.
         """
 
-        if altaz not in ["azimuth", "elevation"]:
+        if altaz == "azimuth":
+            term_function = self.azimuth_model_terms
+            term_names = self.azimuth_term_names
+            parameter_vector = self._param_az
+        elif altaz == "elevation":
+            term_function = self.elevation_model_terms
+            term_names = self.elevation_term_names
+            parameter_vector = self._param_el
+        else:
             info = "altaz argument must be either azimuth or"
             info += " elevation"
             raise RuntimeError(info)
 
-        p = self.model_parameters
-        az_rad = radians(az)
-        el_rad = radians(el)
+        return self._evaluate_terms(term_function, term_names,
+                                    parameter_vector, az, el)
 
-        term_function = {}
-        term_function["azimuth"] = self.azimuth_model_terms
-        term_function["elevation"] = self.elevation_model_terms
+    def _evaluate_terms(self, term_function, term_names, parameter_vector,
+                        az, el):
+        # type: (Callable, tuple, np.ndarray, float, float) -> float
 
-        term_dict = term_function[altaz](az_rad, el_rad)
-        delta = 0.
-        for term in term_dict.keys():
-            delta += p[term] * term_dict[term]
+        """Sum of the terms of term_function weighted with the model
+           parameters. For numerical pointings, the terms are written into
+           a design matrix and contracted with parameter_vector; otherwise,
+           e.g. for symbolic parameters, the terms are summed directly.
 
-        return delta
+        Args:
+            term_function: One of the *_model_terms or *_derivative_* methods.
+            term_names: Term names of term_function, in the order of
+                        parameter_vector.
+            parameter_vector: Parameter values aligned with term_names, or
+                              None.
+            az: Azimuth in degrees; scalar or array.
+            el: Elevation in degrees; scalar or array.
 
-    def delta_azimuth_derivative_phi(self, az, el):
+        Returns:
+            Weighted sum of the terms; an array if az or el is an array.
+        """
 
-        p = self.model_parameters
-        az_rad = radians(az)
-        el_rad = radians(el)
+        az = _as_angle(az)
+        el = _as_angle(el)
 
-        term_dict = self.azimuth_derivative_phi(az_rad, el_rad)
-        delta = 0.
-        for term in term_dict.keys():
-            delta += p[term] * term_dict[term]
+        if parameter_vector is None \
+                or not (_is_numeric(az) and _is_numeric(el)):
+            return self._sum_terms(term_function, term_names, az, el)
 
-        delta = radians(delta)
-        return delta
+        terms = self._fill_terms(term_function, term_names,
+                                 az * _DEG2RAD, el * _DEG2RAD)
 
-    def delta_elevation_derivative_phi(self, az, el):
+        return _contract(parameter_vector, terms)
 
-        p = self.model_parameters
-        az_rad = radians(az)
-        el_rad = radians(el)
+    def _pointing_correction_both(self, az, el):
+        # type: (float, float) -> (float, float)
 
-        term_dict = self.elevation_derivative_phi(az_rad, el_rad)
-        delta = 0.
-        for term in term_dict.keys():
-            delta += p[term] * term_dict[term]
+        """Pointing corrections for both axes.
 
-        return radians(delta)
+        Args:
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
 
-    def delta_azimuth_derivative_theta(self, az, el):
+        Returns:
+            Pointing corrections in azimuth and elevation in degrees.
+        """
 
-        p = self.model_parameters
-        az_rad = radians(az)
-        el_rad = radians(el)
+        az = _as_angle(az)
+        el = _as_angle(el)
 
-        term_dict = self.azimuth_derivative_theta(az_rad, el_rad)
-        delta = 0.
-        for term in term_dict.keys():
-            delta += p[term] * term_dict[term]
+        return (self._pointing_correction(az, el, altaz="azimuth"),
+                self._pointing_correction(az, el, altaz="elevation"))
 
-        return radians(delta)
+    def _parameter_vector(self, term_names):
+        # type: (tuple) -> np.ndarray
 
-    def delta_elevation_derivative_theta(self, az, el):
+        """Parameter values aligned with term_names, or None if the model
+           parameters are not (yet) numerical, e.g. while training.
+        """
+
+        if hasattr(self, "parameters_are_distributions"):
+            return None
+
+        try:
+            p = self.model_parameters
+            return np.array([p[term] for term in term_names], dtype=float)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _fill_terms(self, term_function, term_names, az_rad, el_rad):
+        # type: (Callable, tuple, float, float) -> np.ndarray
+
+        """Design matrix of the model terms.
+
+        Args:
+            term_function: One of the *_model_terms or *_derivative_* methods.
+            term_names: Term order of the rows of the design matrix.
+            az_rad: Azimuth in radians; scalar or ndarray.
+            el_rad: Elevation in radians; scalar or ndarray.
+
+        Returns:
+            Array of shape (len(term_names),) + broadcast shape of az_rad
+            and el_rad.
+        """
+
+        shape = np.broadcast(az_rad, el_rad).shape
+        out = np.empty((len(term_names),) + shape)
+        term_function(az_rad, el_rad, out)
+
+        return out
+
+    def _sum_terms(self, term_function, term_names, az, el):
+        # type: (Callable, tuple, float, float) -> float
+
+        """Sum of the model terms weighted with the model parameters.
+
+        Args:
+            term_function: One of the *_model_terms or *_derivative_* methods.
+            term_names: Term names of term_function, in the order in which
+                        it writes the terms.
+            az: Azimuth in degrees; scalar or array.
+            el: Elevation in degrees; scalar or array.
+
+        Returns:
+            Weighted sum of the terms; an array if az or el is an array.
+        """
 
         p = self.model_parameters
-        az_rad = radians(az)
-        el_rad = radians(el)
+        az_rad = _as_angle(az) * _DEG2RAD
+        el_rad = _as_angle(el) * _DEG2RAD
+
+        # A list rather than an array, as the terms may be symbolic.
+        terms = [None] * len(term_names)
+        term_function(az_rad, el_rad, terms)
+        return sum(p[term] * value for term, value in zip(term_names, terms))
+
+    def delta_azimuth_derivative_phi(self, az, el):
+
+        delta = self._evaluate_terms(self.azimuth_derivative_phi,
+                                     self.azimuth_term_names, self._param_az,
+                                     az, el)
+        return delta * _DEG2RAD
 
-        term_dict = self.elevation_derivative_theta(az_rad, el_rad)
-        delta = 0.
-        for term in term_dict.keys():
-            delta += p[term] * term_dict[term]
+    def delta_elevation_derivative_phi(self, az, el):
+
+        delta = self._evaluate_terms(self.elevation_derivative_phi,
+                                     self.elevation_term_names, self._param_el,
+                                     az, el)
+        return delta * _DEG2RAD
+
+    def delta_azimuth_derivative_theta(self, az, el):
 
-        return radians(delta)
+        delta = self._evaluate_terms(self.azimuth_derivative_theta,
+                                     self.azimuth_term_names, self._param_az,
+                                     az, el)
+        return delta * _DEG2RAD
+
+    def delta_elevation_derivative_theta(self, az, el):
+
+        delta = self._evaluate_terms(self.elevation_derivative_theta,
+                                     self.elevation_term_names, self._param_el,
+                                     az, el)
+        return delta * _DEG2RAD
 
     def delta_azimuth(self, az, el):
         # type: (float, float) -> float
@@ -145,8 +374,8 @@ class CTBendBase(ABC):
         """Pointing correction in azimuth.
 
         Args:
-            az: Requested azimuth in degrees.
-            el: Requested elevation in degrees.
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
 
         Returns:
             Pointing correction in azimuth in degrees.
@@ -160,8 +389,8 @@ class CTBendBase(ABC):
         """Pointing correction in elevation.
 
         Args:
-            az: Requested azimuth in degrees.
-            el: Requested elevation in degrees.
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
 
         Returns:
             Pointing correction in elevation in degrees.
@@ -169,26 +398,164 @@ class CTBendBase(ABC):
 
         return self._pointing_correction(az, el, altaz="elevation")
 
+    def delta_azimuth_elevation(self, az, el):
+        # type: (float, float) -> (float, float)
+
+        """Pointing corrections in azimuth and elevation.
+
+        Args:
+            az: Requested azimuth in degrees; scalar or array.
+            el: Requested elevation in degrees; scalar or array.
+
+        Returns:
+            Pointing corrections in azimuth and elevation in degrees.
+        """
+
+        return self._pointing_correction_both(az, el)
+
     @property
     def model_parameter_names(self):
 
-        name_list = list(self.azimuth_model_terms(0, 0).keys())
-        name_list += list(self.elevation_model_terms(0, 0).keys())
-
-        return np.unique(name_list)
+        return self._model_parameter_names
 
     def serialize(self):
-        return {"model_name": self.modelname(), "parameters": self.parameters}
+        return {"model_name": self.modelname(),
+                "parameters": dict(self._parameters)}
+
+    @property
+    def parameters(self):
+        return MappingProxyType(self._parameters)
 
     @property
     def model_parameters(self):
-        if hasattr(self, "parameters_are_distributions"):
-            parameter_dict = {}
-            for par in self.model_parameter_names:
-                parameter_dict[par] = self.parameters["priors"][par]
-            return parameter_dict
+        return MappingProxyType(self._model_parameters)
+
+    def _invert_fixed_point(self, azimuth, elevation, azimuth0, elevation0,
+                            tolerance, max_iterations=20):
+        # type: (ndarray, ndarray, ndarray, ndarray, float, int) -> tuple
+
+        """Inverts the bending model for all pointings at once with the
+           fixed-point iteration
+
+           az0 <- az - delta_az(az0, el0),
+           el0 <- el - delta_el(az0, el0),
+
+           which is a contraction as long as the corrections vary slowly
+           with the pointing, i.e. for bending parameters well below a
+           radian.
+
+        Args:
+            azimuth: Corrected azimuth coordinates in degrees.
+            elevation: Corrected elevation coordinates in degrees.
+            azimuth0: Initial guess for the uncorrected azimuth in degrees.
+            elevation0: Initial guess for the uncorrected elevation in
+                        degrees.
+            tolerance: Convergence threshold on the step size in degrees.
+            max_iterations: Maximal number of iterations.
+
+        Returns:
+            Uncorrected azimuth and elevation in degrees and a boolean mask
+            of the pointings for which the iteration converged.
+        """
+
+        azimuth0 = azimuth0.copy()
+        elevation0 = elevation0.copy()
+        converged = np.zeros(azimuth.shape, dtype=bool)
 
-        return self.parameters
+        for iteration in range(max_iterations):
+            active = ~converged
+
+            delta_az, delta_el = self._pointing_correction_both(
+                                    azimuth0[active], elevation0[active])
+            azimuth1 = azimuth[active] - delta_az
+            elevation1 = elevation[active] - delta_el
+
+            converged[active] = \
+                (np.abs(azimuth1 - azimuth0[active]) < tolerance) \
+                & (np.abs(elevation1 - elevation0[active]) < tolerance)
+
+            azimuth0[active] = azimuth1
+            elevation0[active] = elevation1
+
+            if converged.all():
+                break
+
+        return azimuth0, elevation0, converged
+
+    def _invert_newton(self, azimuth, elevation, azimuth0, elevation0,
+                       tolerance, max_iterations=20):
+        # type: (ndarray, ndarray, ndarray, ndarray, float, int) -> tuple
+
+        """Inverts the bending model for all pointings at once with a
+           two-dimensional Newton iteration on
+
+           F(az0, el0) = (az - az0 - delta_az(az0, el0),
+                          el - el0 - delta_el(az0, el0)),
+
+           using the analytic derivatives of the model for the Jacobian.
+           Pointings with a singular Jacobian stop iterating and are
+           reported as not converged; the others continue.
+
+        Args:
+            azimuth: Corrected azimuth coordinates in degrees.
+            elevation: Corrected elevation coordinates in degrees.
+            azimuth0: Initial guess for the uncorrected azimuth in degrees.
+            elevation0: Initial guess for the uncorrected elevation in
+                        degrees.
+            tolerance: Convergence threshold on max(|F|) in degrees.
+            max_iterations: Maximal number of Newton steps.
+
+        Returns:
+            Uncorrected azimuth and elevation in degrees and a boolean mask
+            of the pointings for which the iteration converged.
+        """
+
+        azimuth0 = azimuth0.copy()
+        elevation0 = elevation0.copy()
+        singular = np.zeros(azimuth.shape, dtype=bool)
+
+        for iteration in range(max_iterations + 1):
+            delta_az, delta_el = self._pointing_correction_both(azimuth0,
+                                                                elevation0)
+
+            residual_az = azimuth - azimuth0 - delta_az
+            residual_el = elevation - elevation0 - delta_el
+
+            converged = (np.abs(residual_az) < tolerance) \
+                & (np.abs(residual_el) < tolerance)
+            active = ~converged & ~singular
+            if not active.any() or iteration == max_iterations:
+                break
+
+            az0 = azimuth0[active]
+            el0 = elevation0[active]
+
+            j_az_phi = -1. - self.delta_azimuth_derivative_phi(az0, el0)
+            j_az_theta = -self.delta_azimuth_derivative_theta(az0, el0)
+            j_el_phi = -self.delta_elevation_derivative_phi(az0, el0)
+            j_el_theta = -1. - self.delta_elevation_derivative_theta(az0,
+                                                                     el0)
+
+            # Pointings with a (nearly) singular Jacobian keep their
+            # current estimate and are left to the caller; the others
+            # take the Newton step.
+            determinant = j_az_phi * j_el_theta - j_az_theta * j_el_phi
+            solvable = np.abs(determinant) > 1.e-12
+
+            index = np.flatnonzero(active)
+            singular[index[~solvable]] = True
+            index = index[solvable]
+
+            r_az = residual_az[index]
+            r_el = residual_el[index]
+            determinant = determinant[solvable]
+
+            azimuth0[index] -= (j_el_theta[solvable] * r_az
+                                - j_az_theta[solvable] * r_el) / determinant
+            elevation0[index] -= (j_az_phi[solvable] * r_el
+                                  - j_el_phi[solvable] * r_az) / determinant
+
+        return azimuth0, elevation0, converged
 
     def invert_bending_model(self,
                              azimuth,
@@ -201,7 +568,13 @@ class CTBendBase(ABC):
 
            Technically, values for az0 and el0 are searched such that
            the difference between the prediction BendingModel(az0, el0)
-           and the input altaz is minimized.
+           and the input altaz is minimized. All pointings are first
+           inverted at once with a fixed-point iteration, followed by a
+           Newton iteration for the pointings where it does not converge.
+           Remaining pointings are minimized one by one in (az, el) order
+           with L-BFGS-B, using the analytic derivatives of the model, and
+           Nelder-Mead as a last resort; each minimization starts from the
+           solution of the previous pointing.
 
            Args:
            azimuth (List[float]): List of corrected azimuth coordinates
@@ -210,38 +583,112 @@ class CTBendBase(ABC):
                                     in degrees.
            verbose (bool): Flag to control the verbosity of the minimization
                            algorithm.
-           tolerance (float): Tolerance parameter of the minimization
-                              algorithm.
+           tolerance (float): Tolerance parameter of the iterations and
+                              the minimization algorithm.
 
            Returns:
            altaz (List[float], List[float]): Uncorrected altaz coordinates in
                                              degrees.
         """
-        uncorrected_azimuth = []
-        uncorrected_elevation = []
+        azimuth = np.asarray(azimuth, dtype=float)
+        elevation = np.asarray(elevation, dtype=float)
+
+        # First-order inverse as starting point: the corrections vary
+        # slowly, so delta(az0, el0) is close to delta(az, el).
+        delta_az, delta_el = self._pointing_correction_both(azimuth,
+                                                            elevation)
+        azimuth_start = azimuth - delta_az
+        elevation_start = elevation - delta_el
+
+        uncorrected_azimuth, uncorrected_elevation, converged = \
+            self._invert_fixed_point(azimuth, elevation,
+                                     azimuth_start, elevation_start,
+                                     tolerance)
+
+        if converged.all():
+            return uncorrected_azimuth, uncorrected_elevation
+
+        pending = ~converged
+        newton_azimuth, newton_elevation, newton_converged = \
+            self._invert_newton(azimuth[pending], elevation[pending],
+                                azimuth_start[pending],
+                                elevation_start[pending], tolerance)
+
+        uncorrected_azimuth[pending] = newton_azimuth
+        uncorrected_elevation[pending] = newton_elevation
+        converged[pending] = newton_converged
+
+        if converged.all():
+            return uncorrected_azimuth, uncorrected_elevation
 
         def _telescope_pointing_inverter_loss_function(x, az, el):
             az0 = x[0]
             el0 = x[1]
-            a = np.abs(az - az0 - self.delta_azimuth(az0, el0))
-            b = np.abs(el - el0 - self.delta_elevation(az0, el0))
+            delta_az, delta_el = self._pointing_correction_both(az0, el0)
+            a = az - az0 - delta_az
+            b = el - el0 - delta_el
 
-            loss = a + b
+            loss = a * a + b * b
 
             return loss
 
-        for az, el in zip(azimuth, elevation):
-            x0 = (az, el)
-            res = minimize(_telescope_pointing_inverter_loss_function,
-                           x0, args=(az, el), method="nelder-mead",
-                           options={"xtol": tolerance, "disp": verbose})
+        def _telescope_pointing_inverter_loss_and_gradient(x, az, el):
+            az0 = x[0]
+            el0 = x[1]
+            delta_az, delta_el = self._pointing_correction_both(az0, el0)
+            a = az - az0 - delta_az
+            b = el - el0 - delta_el
+
+            gradient = np.empty(2)
+            gradient[0] = -2. * a * (
+                1. + self.delta_azimuth_derivative_phi(az0, el0))
+            gradient[0] -= 2. * b * self.delta_elevation_derivative_phi(
+                                                                    az0, el0)
+            gradient[1] = -2. * a * self.delta_azimuth_derivative_theta(
+                                                                    az0, el0)
+            gradient[1] -= 2. * b * (
+                1. + self.delta_elevation_derivative_theta(az0, el0))
+
+            return a * a + b * b, gradient
+
+        # Pointings are minimized in (az, el) order, so that neighbouring
+        # pointings, e.g. along a trajectory, follow each other and each
+        # can be warm-started from the solution of its predecessor.
+        pending = np.flatnonzero(~converged)
+        order = pending[np.lexsort((elevation[pending], azimuth[pending]))]
+
+        previous = None
+        for i in order:
+            az = azimuth[i]
+            el = elevation[i]
+
+            if previous is None:
+                x0 = (azimuth_start[i], elevation_start[i])
+            else:
+                # Previous solution, shifted by the step in the input.
+                j, x_previous = previous
+                x0 = x_previous + (az - azimuth[j], el - elevation[j])
+
+            res = minimize(_telescope_pointing_inverter_loss_and_gradient,
+                           x0, args=(az, el), jac=True,
+                           method="L-BFGS-B",
+                           options={"ftol": 1.e-16, "gtol": tolerance})
+
+            # The disp option of L-BFGS-B is deprecated in scipy; report
+            # the outcome here instead.
+            if verbose:
+                info = "L-BFGS-B at (az, el)=(" + str(az) + ", " + str(el)
+                info += "): " + str(res.message)
+                logging.getLogger(__name__).info(info)
 
             if not res.success:
-                res = minimize(self._telescope_pointing_inverter_loss_function,
-                               x0, args=(az, el), method="L-BFGS-B",
-                               options={"disp": verbose})
+                res = minimize(_telescope_pointing_inverter_loss_function,
+                               x0, args=(az, el),
+                               method="nelder-mead",
+                               options={"xatol": tolerance, "disp": verbose})
 
-            uncorrected_azimuth.append(res.x[0])
-            uncorrected_elevation.append(res.x[1])
+            uncorrected_azimuth[i] = res.x[0]
+            uncorrected_elevation[i] = res.x[1]
+            previous = (i, res.x)
 
-        return np.array(uncorrected_azimuth), np.array(uncorrected_elevation)
+        return uncorrected_azimuth, uncorrected_elevation
@@ -0,0 +1,116 @@
+import ctbend.ctbendbase as ctbendbase
+import numpy as np
+
+
+models = [
+    ctbendbase.CTBendBasic4({"IA": -0.8, "IE": 1.1, "AW": -0.2, "AN": 0.3}),
+    ctbendbase.CTBendBasic8({"IA": -1., "IE": 1.2, "AN": 0.3, "AW": -0.1,
+                             "NPAE": 0.05, "ACES": 0.02, "ACEC": -0.03,
+                             "TF": 0.1}),
+    ctbendbase.ConstantOffsetModel({"azimuth_offset_deg": 0.5,
+                                    "elevation_offset_deg": -0.2}),
+]
+
+rng = np.random.default_rng(42)
+azimuth = rng.uniform(0, 360, 100)
+elevation = rng.uniform(5, 85, 100)
+
+
+def test_scalar_and_array_corrections_agree():
+    """Single pointings, evaluated with the math module, and arrays of
+       pointings, evaluated with numpy, give the same corrections.
+    """
+
+    for model in models:
+        delta_az = model.delta_azimuth(azimuth, elevation)
+        delta_el = model.delta_elevation(azimuth, elevation)
+
+        for i, (az, el) in enumerate(zip(azimuth, elevation)):
+            az = float(az)
+            el = float(el)
+
+            assert np.isclose(model.delta_azimuth(az, el), delta_az[i],
+                              rtol=1.e-12, atol=1.e-12)
+            assert np.isclose(model.delta_elevation(az, el), delta_el[i],
+                              rtol=1.e-12, atol=1.e-12)
+            assert np.allclose(model.delta_azimuth_elevation(az, el),
+                               (delta_az[i], delta_el[i]),
+                               rtol=1.e-12, atol=1.e-12)
+
+        delta_both = model.delta_azimuth_elevation(azimuth, elevation)
+        assert np.allclose(delta_both, (delta_az, delta_el),
+                           rtol=1.e-12, atol=1.e-12)
+
+
+def test_derivatives_agree_with_corrections():
+    """The derivative methods, used by the inverter, agree with finite
+       differences of the corrections.
+    """
+
+    step = 1.e-6
+
+    for model in models:
+        for derivative, delta, axis in (
+                (model.delta_azimuth_derivative_phi,
+                 model.delta_azimuth, 0),
+                (model.delta_azimuth_derivative_theta,
+                 model.delta_azimuth, 1),
+                (model.delta_elevation_derivative_phi,
+                 model.delta_elevation, 0),
+                (model.delta_elevation_derivative_theta,
+                 model.delta_elevation, 1)):
+
+            shift = np.array([step, 0.]) if axis == 0 \
+                else np.array([0., step])
+            numerical = (delta(azimuth + shift[0], elevation + shift[1])
+                         - delta(azimuth - shift[0], elevation - shift[1]))
+            numerical /= 2. * step
+
+            assert np.allclose(derivative(azimuth, elevation), numerical,
+                               atol=1.e-6)
+
+
+def test_evaluate_many_agrees_with_models():
+    """Corrections of many parameter sets at once agree with the models
+       built from each parameter set.
+    """
+
+    for model in models:
+        parameter_sets = []
+        for scale in np.linspace(-2., 2., 5):
+            parameter_sets.append({name: scale * value for name, value
+                                   in model.model_parameters.items()})
+
+        delta_az, delta_el = type(model).evaluate_many(parameter_sets,
+                                                       azimuth, elevation)
+
+        for i, parameters in enumerate(parameter_sets):
+            scaled_model = type(model)(parameters)
+            assert np.allclose(delta_az[i],
+                               scaled_model.delta_azimuth(azimuth, elevation))
+            assert np.allclose(delta_el[i],
+                               scaled_model.delta_elevation(azimuth,
+                                                            elevation))
+
+
+def test_models_are_immutable():
+    """The parameters of a model cannot be changed after construction, so
+       they always match its corrections.
+    """
+
+    for model in models:
+        name = model.model_parameter_names[0]
+        for parameters in (model.parameters, model.model_parameters):
+            try:
+                parameters[name] = 5.
+            except TypeError:
+                continue
+            raise AssertionError("Parameters of a model were changed")
+
+
+if __name__ == "__main__":
+    test_scalar_and_array_corrections_agree()
+    test_derivatives_agree_with_corrections()
+    test_evaluate_many_agrees_with_models()
+    test_models_are_immutable()
+    print("Corrections and derivatives of the models are consistent.")
@@ -0,0 +1,71 @@
+import ctbend.ctbendbase as ctbendbase
+import importlib
+import numpy as np
+
+
+# Module of CTBendBase, whose name is shadowed by the class in the package.
+ctbendbase_module = importlib.import_module("ctbend.ctbendbase.CTBendBase")
+
+models = [
+    ctbendbase.CTBendBasic4({"IA": -0.8, "IE": 1.1, "AW": -0.2, "AN": 0.3}),
+    ctbendbase.CTBendBasic8({"IA": -1., "IE": 1.2, "AN": 0.3, "AW": -0.1,
+                             "NPAE": 0.05, "ACES": 0.02, "ACEC": -0.03,
+                             "TF": 0.1}),
+    ctbendbase.ConstantOffsetModel({"azimuth_offset_deg": 0.5,
+                                    "elevation_offset_deg": -0.2}),
+]
+
+rng = np.random.default_rng(7)
+azimuth = rng.uniform(0, 360, 50)
+elevation = rng.uniform(5, 85, 50)
+
+
+def assert_round_trip(model, azimuth0, elevation0):
+    """The corrections at the inverted pointings lead back to the input."""
+
+    delta_az, delta_el = model.delta_azimuth_elevation(azimuth0, elevation0)
+
+    assert np.allclose(azimuth0 + delta_az, azimuth, rtol=0., atol=1.e-9)
+    assert np.allclose(elevation0 + delta_el, elevation, rtol=0., atol=1.e-9)
+
+
+def test_inversion_round_trip():
+    """With the default tolerance, the batched iterations invert the
+       models.
+    """
+
+    for model in models:
+        azimuth0, elevation0 = model.invert_bending_model(azimuth, elevation)
+        assert_round_trip(model, azimuth0, elevation0)
+
+
+def test_inversion_round_trip_with_minimizer():
+    """With a vanishing tolerance, neither the fixed-point nor the Newton
+       iteration reports convergence, so all pointings are minimized one by
+       one, warm-started in (az, el) order.
+    """
+
+    methods = []
+    minimize = ctbendbase_module.minimize
+
+    def recording_minimize(*args, **kwargs):
+        methods.append(kwargs["method"])
+        return minimize(*args, **kwargs)
+
+    ctbendbase_module.minimize = recording_minimize
+    try:
+        for model in models:
+            del methods[:]
+            azimuth0, elevation0 = model.invert_bending_model(
+                                            azimuth, elevation, tolerance=0.)
+
+            assert methods.count("L-BFGS-B") == len(azimuth)
+            assert_round_trip(model, azimuth0, elevation0)
+    finally:
+        ctbendbase_module.minimize = minimize
+
+
+if __name__ == "__main__":
+    test_inversion_round_trip()
+    test_inversion_round_trip_with_minimizer()
+    print("Inverted pointings round-trip through the models.")